@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import re
 import warnings
 from abc import ABCMeta, abstractmethod
-from logging import getLogger
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from importlib import import_module
+from logging import DEBUG, getLogger
 from pathlib import Path
-from typing import Any, Generic, Literal, Protocol, TypeVar
+from types import ModuleType
+from typing import Any, Generic, Iterable, Literal, Protocol, TypeVar
 
-from pandas import DataFrame, Timedelta, Timestamp
+from pandas import DataFrame, Index, MultiIndex, Timedelta, Timestamp
 from slugify import slugify
 from typing_extensions import ParamSpec, Self
 
-from ..io import get_path, read, update
+# imported via importlib so mypy does not need orjson (or its stubs)
+# to be installed; the module is typed `ModuleType | None`, keeping the
+# json fallback below reachable under `warn_unreachable`
+try:
+    orjson: ModuleType | None = import_module("orjson")
+except ImportError:
+    orjson = None
+
+from ..io import Format, get_path, read, update
 
 T = TypeVar("T", contravariant=True)
 
@@ -41,6 +57,157 @@ TIndex = TypeVar("TIndex")
 """The type of index in DataFrame."""
 PGet = ParamSpec("PGet")
 """The type of arguments for `self.get()`."""
+MAX_RAW_NAME_LENGTH = 64
+"""The maximum length of raw name before hashing is used instead of slugify."""
+_FAST_SLUG = re.compile(r"[^a-z0-9]+")
+"""Matches character runs that slugify would replace with the separator."""
+
+
+def _slug(raw: str) -> str:
+    """Generate safe name from raw string, equivalent to `slugify(raw)`.
+    For ASCII input (the common case: dates, symbols) a single
+    precompiled regex substitution is used, which is far cheaper
+    than slugify's full Unicode normalization pipeline.
+    HTML entities ("&") and commas are handled differently by slugify,
+    so those fall through to the slow path.
+
+    Parameters
+    ----------
+    raw : str
+        The raw name built from arguments.
+
+    Returns
+    -------
+    str
+        The name of cache file.
+    """
+    if raw.isascii() and "&" not in raw and "," not in raw:
+        return _FAST_SLUG.sub("-", raw.lower()).strip("-")
+    return slugify(raw)
+
+
+@lru_cache(maxsize=4096)
+def _name_from_raw(raw: str) -> str:
+    """Generate safe name from raw string. Memoized because slugify
+    runs regex-heavy Unicode normalization on every call, which is
+    wasteful when `update()` is called repeatedly with the same arguments.
+    Overlong names are shortened to a slugified prefix plus a blake2b digest.
+
+    Parameters
+    ----------
+    raw : str
+        The raw name built from arguments.
+
+    Returns
+    -------
+    str
+        The name of cache file.
+    """
+    if len(raw) > MAX_RAW_NAME_LENGTH:
+        digest = blake2b(raw.encode(), digest_size=16).hexdigest()
+        return f"{_slug(raw[:MAX_RAW_NAME_LENGTH])}-{digest}"
+    return _slug(raw)
+
+
+MEM_CACHE_SIZE = 128
+"""The maximum number of DataFrames kept in the in-memory cache."""
+_MEM_CACHE: OrderedDict[Path, tuple[int, DataFrame]] = OrderedDict()
+"""In-memory LRU cache of loaded DataFrames, keyed by path with mtime
+invalidation. Avoids re-reading and decompressing the cache file when
+`update()` is called repeatedly and nothing changed on disk."""
+
+
+def _mem_cache_get(path: Path) -> DataFrame | None:
+    """Get DataFrame from the in-memory cache if it is still fresh.
+
+    Parameters
+    ----------
+    path : Path
+        The path to cache file.
+
+    Returns
+    -------
+    DataFrame | None
+        The cached DataFrame, or None if missing or stale.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    entry = _MEM_CACHE.get(path)
+    if entry is not None and entry[0] == mtime:
+        _MEM_CACHE.move_to_end(path)
+        return entry[1]
+    return None
+
+
+def _mem_cache_put(path: Path, df: DataFrame) -> None:
+    """Store DataFrame in the in-memory cache,
+    evicting the least recently used entries beyond `MEM_CACHE_SIZE`.
+
+    Parameters
+    ----------
+    path : Path
+        The path to cache file.
+    df : DataFrame
+        The DataFrame matching the current contents of cache file.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return
+    _MEM_CACHE[path] = (mtime, df)
+    _MEM_CACHE.move_to_end(path)
+    while len(_MEM_CACHE) > MEM_CACHE_SIZE:
+        _MEM_CACHE.popitem(last=False)
+
+
+_WARNED_PATHS: set[Path] = set()
+"""Paths for which an unexpected-type warning has already been logged,
+so the `warnings` stack-walk cost is not paid on every read."""
+
+
+def _warn_if_not_dataframe(df: Any, source: str) -> None:
+    """Warn if `df` is not a DataFrame. Only called under `__debug__`
+    so that `python -O` strips the isinstance check from the hot path.
+
+    Parameters
+    ----------
+    df : Any
+        The object to check.
+    source : str
+        Where the object came from, used in the warning message.
+    """
+    if not isinstance(df, DataFrame):
+        warnings.warn(
+            f"Unexpected type from {source}: {type(df)}\n" "Expected: DataFrame",
+            RuntimeWarning,
+        )
+
+
+def _index_bounds(index: Index) -> tuple[Any, Any]:
+    """Get the first and last values of index.
+    O(1) on monotonic (append-only) indices, falling back to
+    a full `min()`/`max()` scan otherwise.
+
+    Parameters
+    ----------
+    index : Index
+        The index of historical data.
+
+    Returns
+    -------
+    tuple[Any, Any]
+        The minimum and maximum values of index.
+    """
+    if len(index) == 0:
+        return None, None
+    if index.is_monotonic_increasing:
+        return index[0], index[-1]
+    try:
+        return index.min(), index.max()
+    except TypeError:
+        return index[0], index[-1]
 
 
 class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
@@ -64,7 +231,7 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
             async def get(self, start: Timestamp | None, *args: Any, **kwargs: Any) -> DataFrame:
                 start = start or Timestamp.utcnow().floor("10D")
                 date_range_chunk = date_range(start, Timestamp.utcnow(), freq="D")
-                return DataFrame({"day": [d.day for d in date_range_chunk]}, index=date_range_chunk)
+                return DataFrame({"day": date_range_chunk.day}, index=date_range_chunk)
 
         df = await MyCache().update()
     """
@@ -80,29 +247,71 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
     """The action when data mismatch. If int, log level. If None, do nothing."""
     keep: Literal["first", "last"] = "last"
     """Which duplicated index to keep."""
-    compress: int | str | tuple[str, int] = ("lz4", 3)
-    """The compression level."""
-    protocol: int | None = None
-    """The pickle protocol."""
+    format: Format = "feather"
+    """The serialization format of cache file.
+    "feather" and "parquet" use Arrow and fall back to pickle
+    for non-Arrow-serializable dtypes."""
+    compress: int | str | tuple[str, int] = ("lz4", 1)
+    """The compression level for pickle."""
+    compress_min_bytes: int = 65536
+    """The minimum in-memory size of DataFrame to compress.
+    Below this, compression framing overhead exceeds any space saved.
+    If 0, always compress."""
+    human_names: bool = True
+    """Whether to build human-readable (slugified) cache filenames
+    from the arguments. If False, the arguments are serialized
+    (via orjson when installed, avoiding pandas' costly `str()`
+    formatting of Timestamps) and hashed with blake2b instead,
+    which is faster for argument-heavy tight loops but opaque on disk."""
+    incremental: bool = False
+    """Whether to store the cache as append-only part files.
+    Each update writes only the new rows instead of rewriting
+    the entire cache file, which is beneficial for large
+    monotonic (append-only) caches."""
+    protocol: int | None = 5
+    """The pickle protocol. Protocol 5 passes NumPy buffers
+    out-of-band without copying them through Python bytes."""
     subtract_interval_from_end_index: bool = True
     """Whether to get the latest uncompleted chunk.
     If False, make sure to set `self.add_interval_to_start_index` to False
     to avoid uncompleted chunk left in cache file."""
+    now: Timestamp | None = None
+    """The wall clock at the start of the current `update()` call,
+    or None outside of `update()`. `self.get()`/`self.get_one()`
+    overrides can use `self.now or Timestamp.utcnow()` instead of
+    calling `Timestamp.utcnow()` per chunk, keeping all chunks of one
+    update cycle consistent and avoiding repeated clock reads.
+    Only set when `self.interval` is a Timedelta."""
+    connector_limit_per_host: int = 64
+    """The maximum number of simultaneous connections per host
+    for the `aiohttp.ClientSession` created by `async with`.
+    Only used if the cache is used as an async context manager."""
+    session: Any = None
+    """The shared `aiohttp.ClientSession`, set while the cache is used
+    as an async context manager (`async with MyCache() as cache: ...`).
+    Reusing one session across `self.get_one()` calls keeps connections
+    alive instead of paying a TCP/TLS handshake per chunk.
+    Requires `aiohttp` to be installed."""
 
     @property
     def end_index_base(self) -> TIndex:
         """The end index of historical data.
         This property is only used in default `self.to_update()`."""
-        if isinstance(self.interval, Timedelta):
-            return Timestamp.utcnow()
+        if self._interval_is_timedelta:
+            return self.now or Timestamp.utcnow()
         raise NotImplementedError
 
     @property
     def end_index(self) -> TIndex:
         """The end index of historical data. If `self.subtract_interval_from_end_index` is False,
         the end index is the latest uncompleted chunk.
+        The value is snapshotted once per `update()` call so that
+        `Timestamp.utcnow()` is not recomputed on every access.
         This property is only used in default `self.to_update()`.
         Consider overriding `end_index_base` instead of this property."""
+        cached = getattr(self, "_end_index", None)
+        if cached is not None:
+            return cached
         if not self.subtract_interval_from_end_index:
             return self.end_index_base
         return self.end_index_base - self.interval  # type: ignore
@@ -110,6 +319,13 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
     def __init__(self) -> None:
         """Initialize HistoricalDataCache."""
         self.folder = self.__class__.__name__
+        self._path_cache: dict[tuple[str, str], Path] = {}
+        self._end_value: int | None = None
+        # specialize the common Timestamp/Timedelta case once instead of
+        # running isinstance on every end_index_base access
+        self._interval_is_timedelta = isinstance(
+            getattr(self, "interval", None), Timedelta
+        )
 
         if (
             not self.subtract_interval_from_end_index
@@ -122,8 +338,36 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
                 RuntimeWarning,
             )
 
+    async def __aenter__(self) -> Self:
+        """Create a shared `aiohttp.ClientSession` exposed as `self.session`.
+
+        Returns
+        -------
+        Self
+            This cache, with `self.session` set.
+
+        Raises
+        ------
+        ImportError
+            If `aiohttp` is not installed.
+        """
+        import aiohttp
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.connector_limit_per_host)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the shared `aiohttp.ClientSession`."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
     def path(self, name: str) -> Path:
         """Get path to cache file.
+        The result is memoized per instance because `pathlib`
+        construction is measurable when `update()` is called repeatedly.
 
         Parameters
         ----------
@@ -135,21 +379,37 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
         Path
             The path to cache file.
         """
-        return get_path(self.folder, name)
+        key = (name, self.format)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = get_path(
+                self.folder, name, format=self.format
+            )
+        return path
 
     def name_from_args_kwargs(self, *args: Any, **kwargs: Any) -> str:
         """Generate safe name from arguments using slugify.
+        The result is memoized per raw argument string,
+        and overlong names are hashed with blake2b.
+        If `self.human_names` is False, the arguments are hashed
+        directly without string formatting.
 
         Returns
         -------
         str
             The name of cache file.
         """
-        name = "_".join([str(arg) for arg in args]) + "_".join(
-            [f"{key}-{value}" for key, value in kwargs.items()]
-        )
-        name = slugify(name)
-        return name
+        if not self.human_names:
+            items = (args, sorted(kwargs.items()))
+            if orjson is not None:
+                data = orjson.dumps(items, default=str)
+            else:
+                data = json.dumps(items, default=str).encode()
+            return blake2b(data, digest_size=16).hexdigest()
+        raw = "_".join(map(str, args))
+        if kwargs:
+            raw += "_".join(f"{key}-{value}" for key, value in kwargs.items())
+        return _name_from_raw(raw)
 
     def path_from_args_kwargs(self, *args: Any, **kwargs: Any) -> Path:
         """Get path to cache file from arguments.
@@ -194,66 +454,161 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
         name = self.name_from_args_kwargs(*args, **kwargs)
         path = self.path(name)
 
-        # read
-        df = await read(path) if not reload else DataFrame()
-        self.df_old = df.copy()
-        if not isinstance(df, DataFrame):
-            warnings.warn(
-                f"Unexpected type read from {path}: {type(df)}\n",
-                RuntimeWarning,
+        # reset the per-call state even when self.get() raises, so a
+        # failed update never leaves a stale clock or end-index snapshot
+        try:
+            # read the wall clock once per call; reused by end_index_base
+            # and available to get()/get_one() overrides as `self.now`
+            if self._interval_is_timedelta:
+                self.now = Timestamp.utcnow()
+            # snapshot the end index once per call; to_update() and the chunk
+            # classes may read it many times within a single update()
+            self._end_index: TIndex | None = None
+            try:
+                self._end_index = self.end_index
+            except NotImplementedError:
+                pass
+            # specialize the common Timestamp case to a plain integer
+            # comparison in to_update(), which runs once per chunk
+            self._end_value = (
+                self._end_index.value
+                if isinstance(self._end_index, Timestamp)
+                else None
             )
 
-        # check if need to update
-        start = None
-        if not df.empty:
-            start = df.index.max()
-        if isinstance(start, tuple):
-            start = start[0]
-        to_update = self.to_update(start, *args, **kwargs)
-
-        # update
-        if to_update:
-            df = await self.get(
-                ((start + self.interval) if self.add_interval_to_start_index else start)
-                if not df.empty
-                else None,
-                *args,
-                **kwargs,
-            )
-            if not isinstance(df, DataFrame):
-                warnings.warn(
-                    f"Unexpected type returned from `self.get()`: {type(df)}\n"
-                    "Expected: DataFrame",
+            # read
+            df = None
+            if reload:
+                df = DataFrame()
+            else:
+                df = _mem_cache_get(path)
+                if df is None:
+                    df = await read(path)
+            # no copy: `df` is only rebound below, never mutated in place,
+            # and copying the entire cached frame doubles peak memory
+            self.df_old = df
+            if (
+                __debug__
+                and not isinstance(df, DataFrame)
+                and path not in _WARNED_PATHS
+            ):
+                _WARNED_PATHS.add(path)
+                LOG.warning(f"Unexpected type read from {path}: {type(df)}")
+
+            # check if need to update
+            start = None
+            if not df.empty:
+                index = df.index
+                if isinstance(index, MultiIndex):
+                    # only the first level is needed; cheaper than a
+                    # lexicographic max over all levels and tuple unwrapping
+                    index = index.get_level_values(0)
+                start = _index_bounds(index)[1]
+            to_update = self.to_update(start, *args, **kwargs)
+
+            # update
+            if to_update:
+                df = await self.get(
+                    (
+                        (start + self.interval)
+                        if self.add_interval_to_start_index
+                        else start
+                    )
+                    if not df.empty
+                    else None,
+                    *args,
+                    **kwargs,
                 )
-            old_len = len(df)
-
-            df = await update(
-                path,
-                df,
-                df_old=self.df_old,
-                mismatch=self.mismatch,
-                keep=self.keep,
-                compress=self.compress,
-                protocol=self.protocol,
-            )
-            try:
-                min_, max_ = df.index.min(), df.index.max()
-            except TypeError:
-                min_, max_ = df.index[0], df.index[-1]
-            LOG.debug(
-                f"Updated {name} from {path}, [{min_}~{max_}]"
-                f" ({old_len}->{len(df)} rows)"
-            )
-        else:
-            try:
-                min_, max_ = df.index.min(), df.index.max()
-            except TypeError:
-                min_, max_ = df.index[0], df.index[-1]
-            LOG.debug(
-                f"Loaded {name} from {path}, [{min_}~{max_}]" f" ({len(df)} rows)"
-            )
-        del self.df_old
-        return df
+                if __debug__:
+                    _warn_if_not_dataframe(df, "`self.get()`")
+                old_len = len(df)
+
+                df = await update(
+                    path,
+                    df,
+                    df_old=self.df_old,
+                    mismatch=self.mismatch,
+                    keep=self.keep,
+                    format=self.format,
+                    compress=self.compress,
+                    protocol=self.protocol,
+                    compress_min_bytes=self.compress_min_bytes,
+                    incremental=self.incremental,
+                )
+                _mem_cache_put(path, df)
+                if LOG.isEnabledFor(DEBUG):
+                    min_, max_ = _index_bounds(df.index)
+                    LOG.debug(
+                        f"Updated {name} from {path}, [{min_}~{max_}]"
+                        f" ({old_len}->{len(df)} rows)"
+                    )
+            else:
+                # under reload=True `df` is the synthetic empty frame,
+                # not the file contents; caching it against the untouched
+                # file's mtime would poison the in-memory cache
+                if not reload:
+                    _mem_cache_put(path, df)
+                if LOG.isEnabledFor(DEBUG):
+                    min_, max_ = _index_bounds(df.index)
+                    LOG.debug(
+                        f"Loaded {name} from {path}, [{min_}~{max_}]"
+                        f" ({len(df)} rows)"
+                    )
+            return df
+        finally:
+            if hasattr(self, "df_old"):
+                del self.df_old
+            self._end_index = None
+            self._end_value = None
+            self.now = None
+
+    @classmethod
+    async def update_many(
+        cls,
+        items: Iterable[
+            tuple["HistoricalDataCache[Any, Any, Any]", tuple[Any, ...], dict[str, Any]]
+        ],
+        *,
+        concurrency: int = 32,
+        reload: bool = False,
+        return_exceptions: bool = False,
+    ) -> list[DataFrame | BaseException]:
+        """Update many caches concurrently, bounded by a semaphore.
+        I/O-bound reads and writes of different caches overlap
+        instead of serializing on the event loop.
+
+        Parameters
+        ----------
+        items : Iterable[tuple[HistoricalDataCache, tuple, dict]]
+            The caches to update with the args and kwargs
+            for each `self.update()` call.
+        concurrency : int, optional
+            The maximum number of concurrent updates, by default 32
+        reload : bool, optional
+            Whether to ignore cache files and reload, by default False
+        return_exceptions : bool, optional
+            If True, exceptions are returned in the result list
+            instead of being raised, by default False
+
+        Returns
+        -------
+        list[DataFrame | BaseException]
+            The updated DataFrames in the order of `items`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _update(
+            cache: HistoricalDataCache[Any, Any, Any],
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> DataFrame:
+            async with semaphore:
+                return await cache.update(reload, *args, **kwargs)
+
+        return await asyncio.gather(
+            *(_update(cache, args, kwargs) for cache, args, kwargs in items),
+            return_exceptions=return_exceptions,
+        )
 
     @abstractmethod
     async def get(
@@ -295,4 +650,10 @@ class HistoricalDataCache(Generic[TIndex, TInterval, PGet], metaclass=ABCMeta):
         bool
             Whether to update cache file.
         """
-        return end is None or end < self.end_index  # type: ignore
+        if end is None:
+            return True
+        if self._end_value is not None and isinstance(end, Timestamp):
+            # compare raw nanosecond values; pandas Timestamp.__lt__
+            # adds up significantly over hundreds of thousands of chunks
+            return end.value < self._end_value
+        return end < self.end_index  # type: ignore
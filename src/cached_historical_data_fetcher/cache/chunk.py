@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-import warnings
 from abc import ABCMeta, abstractmethod
 from logging import getLogger
-from typing import Generic, Sequence
+from typing import Any, Generic, Sequence
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Timestamp, concat
-from tqdm.auto import tqdm
+from tqdm import tqdm
 
-from .base import HistoricalDataCache, PGet, TIndex, TInterval
+from .base import HistoricalDataCache, PGet, TIndex, TInterval, _index_bounds
 
 LOG = getLogger(__name__)
 
 
+def _desc_suffix(*args: Any, **kwargs: Any) -> str:
+    """Format the static (args/kwargs) part of the progress bar description."""
+    return (
+        f"|{' '.join(map(str, args))}"
+        f"|{' '.join(f'{k}={v}' for k, v in kwargs.items())}"
+    )
+
+
 class HistoricalDataCacheWithChunk(
     HistoricalDataCache[TIndex, TInterval, PGet],
     Generic[TIndex, TInterval, PGet],
@@ -116,6 +123,8 @@ class HistoricalDataCacheWithChunk(
         DataFrame
             The chunk of historical data.
             It is recommended to set index to Timestamp or unique incremental number.
+            The index should be sorted (monotonic increasing);
+            the last row is then used as the next start in O(1).
             If the index is not Timestamp,
             override `self.to_update()` to implement the logic as well.
             If MultiIndex is used, the first level will be passed to this method
@@ -144,36 +153,54 @@ class HistoricalDataCacheWithChunk(
         dfs = []
 
         # The progress bar is not accurate because chunk size may not be fixed.
+        # Only an estimated total is needed here, so avoid materializing
+        # the full index range (a multi-decade minute-interval DatetimeIndex
+        # can be tens of MB) just to drive the bar.
         try:
-            new_indices = self.new_indices(
-                start_index, self.end_index, self.df_old.index
-            )
-        except Exception as e:
-            warnings.warn(
-                f"self.new_indices() failed. Progress bar may be inaccurate: {e}"
-            )
-            new_indices = []
-
-        pbar = tqdm(new_indices)
+            total = int((self.end_index - start_index) / self.interval) + 1  # type: ignore
+        except Exception:
+            total = None
+
+        # precompute the static part of the description; formatting all
+        # args per iteration dominates tight loops with delay_seconds=0
+        desc_suffix = _desc_suffix(*args, **kwargs)
+        name = self.__class__.__name__
+        # disable=None turns the bar off on non-TTY output
+        pbar = tqdm(total=total, disable=None)
+        # hoist per-iteration attribute lookups; `Timestamp.utcnow()` is
+        # already evaluated once per update() via the end_index snapshot
+        interval = self.interval
+        delay_seconds = self.delay_seconds
+        add_interval = self.add_interval_to_start_index
         start_current: TIndex = start_index
-        while self.to_update(start_current, *args, **kwargs):
-            df = await self.get_one(start_current, *args, **kwargs)
-            if not isinstance(df, DataFrame):
-                raise TypeError(f"get_one must return DataFrame: {type(df)}")
-
-            dfs.append(df)
-            start_current = df.index.max()
-            if isinstance(start_current, tuple):
-                start_current = start_current[0]
-            if self.add_interval_to_start_index:
-                start_current += self.interval  # type: ignore
-            pbar.update()
-            pbar.set_description(
-                f"{self.__class__.__name__} {start_current}"
-                f"|{' '.join(map(str, args))}|{' '.join([f'{k}={v}' for k, v in kwargs.items()])}"
-            )
-            await asyncio.sleep(self.delay_seconds)
-        return concat(dfs) if len(dfs) > 0 else DataFrame()
+        # close the bar even when get_one() raises; a manually driven
+        # bar is never iterated to exhaustion, so it would otherwise
+        # stay open and garble later terminal output
+        try:
+            while self.to_update(start_current, *args, **kwargs):
+                df = await self.get_one(start_current, *args, **kwargs)
+                # gated on __debug__ so `python -O` strips the per-chunk
+                # check; a wrong type still fails loudly in the final concat
+                if __debug__ and not isinstance(df, DataFrame):
+                    raise TypeError(f"get_one must return DataFrame: {type(df)}")
+
+                dfs.append(df)
+                idx = df.index
+                if isinstance(idx, pd.MultiIndex):
+                    idx = idx.get_level_values(0)
+                # O(1) on the sorted chunks get_one is expected to return,
+                # instead of a full max() scan per chunk
+                start_current = _index_bounds(idx)[1]
+                if add_interval:
+                    start_current += interval  # type: ignore
+                pbar.update()
+                pbar.set_description_str(f"{name} {start_current}{desc_suffix}")
+                await asyncio.sleep(delay_seconds)
+        finally:
+            pbar.close()
+        if len(dfs) == 0:
+            return DataFrame()
+        return dfs[0] if len(dfs) == 1 else concat(dfs, axis=0, sort=False)
 
 
 class HistoricalDataCacheWithFixedChunk(
@@ -215,22 +242,82 @@ class HistoricalDataCacheWithFixedChunk(
         df = await MyCacheWithFixedChunk().update()
     """
 
+    max_concurrency: int = 16
+    """The maximum number of concurrent `self.get_one()` calls.
+    Without a bound, long date ranges would put thousands of requests
+    in flight at once, exhausting sockets or triggering rate limits."""
+
+    async def get_many(
+        self, starts: Sequence[TIndex], *args: PGet.args, **kwargs: PGet.kwargs
+    ) -> DataFrame | None:
+        """Get many chunks of historical data at once.
+        Override this method if the data source supports batched fetching;
+        building one DataFrame for all chunks avoids the per-chunk
+        index construction and dtype inference of 1-row frames.
+        If None is returned (the default), chunks are fetched
+        one by one via `self.get_one()` instead.
+        Note that `self.delay_seconds` is not applied in this case.
+
+        Parameters
+        ----------
+        starts : Sequence[TIndex]
+            The start indices of historical data.
+
+        Returns
+        -------
+        DataFrame | None
+            The chunks of historical data, or None to fall back
+            to per-chunk fetching.
+        """
+        return None
+
     async def get(
         self, start: TIndex | None, *args: PGet.args, **kwargs: PGet.kwargs
     ) -> DataFrame:
         start_index: TIndex = start or self.start_index
-        tasks = []
-
-        pbar = tqdm(self.new_indices(start_index, self.end_index, self.df_old.index))
-        for start_current in pbar:
-            tasks.append(
-                asyncio.create_task(self.get_one(start_current, *args, **kwargs))
-            )
-            pbar.update()
-            pbar.set_description(
-                f"{self.__class__.__name__} {start_current}"
-                f"|{' '.join(map(str, args))}|{' '.join([f'{k}={v}' for k, v in kwargs.items()])}"
-            )
-            await asyncio.sleep(self.delay_seconds)
-        dfs = await asyncio.gather(*tasks)
-        return concat(dfs) if len(dfs) > 0 else DataFrame()
+        new_indices = self.new_indices(start_index, self.end_index, self.df_old.index)
+
+        df_many = await self.get_many(new_indices, *args, **kwargs)
+        if df_many is not None:
+            return df_many
+
+        # bounded producer-consumer: `max_concurrency` workers pull starts
+        # from a queue, so only O(workers) coroutines exist at any time
+        # instead of one pre-created Task per chunk
+        queue: asyncio.Queue[tuple[int, TIndex] | None] = asyncio.Queue()
+        results: list[tuple[int, DataFrame]] = []
+        desc_suffix = _desc_suffix(*args, **kwargs)
+        name = self.__class__.__name__
+        # disable=None turns the bar off on non-TTY output
+        pbar = tqdm(total=len(new_indices), disable=None)
+
+        async def _worker() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                i, start_current = item
+                df = await self.get_one(start_current, *args, **kwargs)
+                results.append((i, df))
+                pbar.update()
+
+        n_workers = max(1, self.max_concurrency)
+        workers = [asyncio.create_task(_worker()) for _ in range(n_workers)]
+        delay_seconds = self.delay_seconds
+        try:
+            for i, start_current in enumerate(new_indices):
+                await queue.put((i, start_current))
+                pbar.set_description_str(f"{name} {start_current}{desc_suffix}")
+                await asyncio.sleep(delay_seconds)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            pbar.close()
+        results.sort(key=lambda item: item[0])
+        dfs = [df for _, df in results]
+        if len(dfs) == 0:
+            return DataFrame()
+        return dfs[0] if len(dfs) == 1 else concat(dfs, axis=0, sort=False)
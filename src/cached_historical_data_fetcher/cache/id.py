@@ -63,16 +63,31 @@ class IdCacheWithFixedChunk(
             If True, ids will be replaced by the given ids.
             If False, ids will be added to the existing ids, by default False
         """
+        # build the Index once; the previous code allocated it twice and
+        # ran a needless self-union when starting fresh
+        new = ids if isinstance(ids, Index) else Index(ids)
         if self.ids is None or refresh:
-            self.ids = Index(ids)
-        self.ids = self.ids.union(Index(ids))
+            # match the dedup the union below would have performed
+            self.ids = new if new.is_unique else new.unique()
+        else:
+            self.ids = self.ids.union(new)
 
     def new_indices(
         self, start: Any, end: Any, old_indices: Sequence[TIndex]
     ) -> Sequence[TIndex]:
         if self.ids is None:
             raise RuntimeError("ids is not set, call `set_ids()` first")
-        return self.ids.difference(Index(old_indices)).to_list()
+        if len(old_indices) == 0:
+            return self.ids.to_list()
+        if self.ids.is_unique:
+            # a plain set diff beats Index.difference by a wide margin
+            # for object-dtype ids and skips its O(n log n) sort
+            old_set = set(old_indices)
+            return [i for i in self.ids if i not in old_set]
+        # `update()` hands us `self.df_old.index`, which is already an
+        # Index; avoid reallocating it just to take the difference
+        old = old_indices if isinstance(old_indices, Index) else Index(old_indices)
+        return self.ids.difference(old, sort=False).to_list()
 
     def to_update(self, end: TIndex, *args: Any, **kwargs: Any) -> bool:
         return True
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import warnings
 from io import BytesIO
 from logging import getLogger
@@ -8,14 +10,48 @@ from typing import Literal
 
 import aiofiles
 import joblib
-from pandas import DataFrame, concat
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, concat, read_feather, read_parquet
 from pandas.testing import assert_frame_equal
 
 BASE_PATH = Path(f"~/.cache/{__name__.split('.')[0]}").expanduser()
 LOG = getLogger(__name__)
+Format = Literal["feather", "parquet", "pickle"]
+"""The serialization format of cache file."""
+SUFFIXES: dict[str, str] = {
+    "feather": ".feather",
+    "parquet": ".parquet",
+    "pickle": ".lz4",
+}
+"""The file suffix for each format."""
+MAX_PARTS = 32
+"""The maximum number of part files of an incremental cache before compaction."""
+_MKDIR_CACHE: set[Path] = set()
+"""Directories already created by `save()`, so that repeated updates
+do not pay a mkdir syscall per save."""
 
 
-def get_path(folder: str, name: str) -> Path:
+def _part_path(path: Path, n: int, format: Format) -> Path:
+    """Get path to the n-th part file of an incremental cache.
+
+    Parameters
+    ----------
+    path : Path
+        The path to cache file, used as the part directory.
+    n : int
+        The part number.
+    format : Format
+        The serialization format.
+
+    Returns
+    -------
+    Path
+        The path to part file.
+    """
+    return path / f"{n:08d}{SUFFIXES[format]}"
+
+
+def get_path(folder: str, name: str, *, format: Format = "feather") -> Path:
     """Get path to cache file.
 
     Parameters
@@ -24,17 +60,59 @@ def get_path(folder: str, name: str) -> Path:
         The folder name.
     name : str
         The file name.
+    format : Format, optional
+        The serialization format, by default "feather"
 
     Returns
     -------
     Path
         The path to cache file.
     """
-    return BASE_PATH / folder / f"{name}.lz4"
+    return BASE_PATH / folder / f"{name}{SUFFIXES[format]}"
+
+
+def _load(path: Path) -> DataFrame:
+    """Deserialize cache file, streaming directly from the path
+    (letting pyarrow memory-map and joblib stream-decompress)
+    instead of buffering the whole file through BytesIO first,
+    which doubled peak memory for large caches.
+    The format is inferred from the file suffix
+    (Feather/Parquet via pyarrow, pickle via joblib otherwise).
+    If parsing in the inferred format fails, fall back to joblib
+    because `save()` may have fallen back to pickle for
+    non-Arrow-serializable dtypes.
+
+    Parameters
+    ----------
+    path : Path
+        The path to cache file.
+
+    Returns
+    -------
+    DataFrame
+        The deserialized DataFrame.
+    """
+    # note: `path.suffix` is empty for names like ".feather"
+    if path.name.endswith(SUFFIXES["feather"]):
+        try:
+            return read_feather(path)
+        except Exception as e:
+            LOG.debug(f"Falling back to joblib for {path}: {e}")
+    elif path.name.endswith(SUFFIXES["parquet"]):
+        try:
+            return read_parquet(path)
+        except Exception as e:
+            LOG.debug(f"Falling back to joblib for {path}: {e}")
+    return joblib.load(path)
 
 
 async def read(path: Path) -> DataFrame:
-    """Read cache file using joblib and aiofiles, and return DataFrame.
+    """Read cache file and return DataFrame.
+    If `path` is a directory, it is an incremental cache and
+    all part files inside are read and concatenated in order.
+    Deserialization runs in a thread so that decompression and
+    unpickling do not block the event loop when many caches
+    update concurrently.
     If cache file does not exist, return empty DataFrame.
 
     Parameters
@@ -47,21 +125,94 @@ async def read(path: Path) -> DataFrame:
     DataFrame
         The DataFrame read from cache file.
     """
+    if path.is_dir():
+        dfs = []
+        for part in sorted(path.iterdir()):
+            if part.name.endswith(".tmp"):
+                # leftover from an interrupted save()
+                continue
+            dfs.append(await asyncio.to_thread(_load, part))
+        return concat(dfs, axis=0) if len(dfs) > 0 else DataFrame()
     if path.exists():
-        async with aiofiles.open(path, "rb") as f:
-            with BytesIO(await f.read()) as f2:
-                return joblib.load(f2)
+        return await asyncio.to_thread(_load, path)
     return DataFrame()
 
 
+def _dump(
+    path: Path,
+    df: DataFrame,
+    format: Format,
+    compress: int | str | tuple[str, int],
+    protocol: int | None,
+    compress_min_bytes: int,
+) -> bytes:
+    """Serialize DataFrame to bytes.
+    If `format` is "feather" or "parquet" but the DataFrame
+    cannot be represented in Arrow (e.g. arbitrary object columns),
+    fall back to joblib pickle.
+    DataFrames smaller than `compress_min_bytes` are written
+    uncompressed, as framing overhead exceeds any space saved.
+    Both joblib and Arrow detect the compression on read,
+    so no flag needs to be stored.
+
+    Parameters
+    ----------
+    path : Path
+        The path to cache file, used only for logging.
+    df : DataFrame
+        The DataFrame to serialize.
+    format : Format
+        The serialization format.
+    compress : int | str | tuple[str, int]
+        The compression level for pickle.
+    protocol : int | None
+        The pickle protocol.
+    compress_min_bytes : int
+        The minimum in-memory size to compress. If 0, always compress.
+
+    Returns
+    -------
+    bytes
+        The serialized DataFrame.
+    """
+    if compress_min_bytes > 0 and df.memory_usage(deep=True).sum() < compress_min_bytes:
+        compress = 0
+        compression = "uncompressed"
+    else:
+        compression = "lz4"
+    with BytesIO() as f:
+        try:
+            if format == "feather":
+                df.to_feather(f, compression=compression)
+            elif format == "parquet":
+                df.to_parquet(
+                    f, compression=None if compression == "uncompressed" else "zstd"
+                )
+            else:
+                joblib.dump(df, f, compress=compress, protocol=protocol)
+        except Exception as e:
+            LOG.debug(f"Falling back to pickle for {path}: {e}")
+            f.seek(0)
+            f.truncate()
+            joblib.dump(df, f, compress=compress, protocol=protocol)
+        return f.getvalue()
+
+
 async def save(
     path: Path,
     df: DataFrame,
     *,
-    compress: int | str | tuple[str, int] = ("lz4", 3),
-    protocol: int | None = None,
+    format: Format = "feather",
+    compress: int | str | tuple[str, int] = ("lz4", 1),
+    protocol: int | None = 5,
+    compress_min_bytes: int = 65536,
 ) -> None:
-    """Save DataFrame to cache file using joblib and aiofiles.
+    """Save DataFrame to cache file using aiofiles.
+    Serialization runs in a thread so that compression and pickling
+    do not block the event loop when many caches update concurrently.
+    The file is written to a temporary sibling and atomically renamed
+    so that an interrupted write never leaves a truncated cache,
+    which would force a full rebuild on the next update.
 
     Parameters
     ----------
@@ -69,16 +220,38 @@ async def save(
         The path to cache file.
     df : DataFrame
         The DataFrame to save.
+    format : Format, optional
+        The serialization format, by default "feather"
     compress : int | str | tuple[str, int], optional
-        The compression level, by default ("lz4", 3)
+        The compression level for pickle, by default ("lz4", 1)
     protocol : int | None, optional
-        The pickle protocol, by default None (latest protocol)
+        The pickle protocol, by default 5
+        Protocol 5 passes NumPy buffers out-of-band without
+        copying them through Python bytes.
+    compress_min_bytes : int, optional
+        The minimum in-memory size to compress, by default 65536
+        If 0, always compress.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with BytesIO() as f:
-        joblib.dump(df, f, compress=compress, protocol=protocol)
-        async with aiofiles.open(path, "wb") as f2:
-            await f2.write(f.getvalue())
+    parent = path.parent
+    if parent not in _MKDIR_CACHE:
+        parent.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+    data = await asyncio.to_thread(
+        _dump, path, df, format, compress, protocol, compress_min_bytes
+    )
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f2:
+            await f2.write(data)
+    except FileNotFoundError:
+        # the directory was removed externally after being cached above
+        _MKDIR_CACHE.discard(parent)
+        parent.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+        async with aiofiles.open(tmp_path, "wb") as f2:
+            await f2.write(data)
+    # atomic on both POSIX and Windows
+    os.replace(tmp_path, path)
 
 
 async def update(
@@ -89,8 +262,11 @@ async def update(
     reload: bool = False,
     mismatch: Literal["warn", "raise"] | int | None = "warn",
     keep: Literal["first", "last"] = "last",
-    compress: int | str | tuple[str, int] = ("lz4", 3),
-    protocol: int | None = None,
+    format: Format = "feather",
+    compress: int | str | tuple[str, int] = ("lz4", 1),
+    protocol: int | None = 5,
+    compress_min_bytes: int = 65536,
+    incremental: bool = False,
 ) -> DataFrame:
     """Update cache file with DataFrame.
 
@@ -112,10 +288,24 @@ async def update(
         If int, log level. If None, do nothing.
     keep : Literal["first", "last"], optional
         Which duplicated index to keep, by default "last" (has no effect if mismatch is "raise")
+    format : Format, optional
+        The serialization format, by default "feather"
     compress : int | str | tuple[str, int], optional
-        The compression level, by default ("lz4", 3)
+        The compression level for pickle, by default ("lz4", 1)
     protocol : int | None, optional
-        The pickle protocol, by default None (latest protocol)
+        The pickle protocol, by default 5
+        Protocol 5 passes NumPy buffers out-of-band without
+        copying them through Python bytes.
+    compress_min_bytes : int, optional
+        The minimum in-memory size to compress, by default 65536
+        If 0, always compress.
+    incremental : bool, optional
+        Whether to store the cache as append-only part files
+        under a directory at `path`, by default False
+        New non-overlapping data is written as a new part file
+        instead of rewriting the entire cache.
+        Parts are compacted into one when they exceed `MAX_PARTS`
+        or when new data overlaps the cached index.
 
     Returns
     -------
@@ -124,27 +314,107 @@ async def update(
     """
     if df_old is None:
         df_old = await read(path) if not reload else DataFrame()
+    df_new = df
 
     # check if duplicated data is same
+    idx = None
     if len(df_old) > 0:
-        idx = df.index.intersection(df_old.index)
-        try:
-            assert_frame_equal(df_old.loc[idx], df.loc[idx], rtol=1e-3)
-        except AssertionError as e:
-            if mismatch == "raise":
-                raise e
-            elif mismatch == "warn":
-                warnings.warn(
-                    f"Data mismatch. Left: cache, Right: new\n{e}", RuntimeWarning
-                )
-            elif isinstance(mismatch, int):
-                LOG.log(mismatch, f"Data mismatch. Left: cache, Right: new\n{e}")
-            else:
-                pass
+        idx = df.index.intersection(df_old.index, sort=False)
+        if mismatch is not None and len(idx) > 0:
+            left, right = df_old.loc[idx], df.loc[idx]
+            # exact array comparison first; assert_frame_equal is one of
+            # the dominant costs on large overlaps and is only needed to
+            # produce a diagnostic (or apply rtol) when values differ
+            equal = False
+            if left.shape == right.shape:
+                try:
+                    equal = bool(np.array_equal(left.to_numpy(), right.to_numpy()))
+                except Exception:
+                    equal = False
+            if not equal:
+                try:
+                    assert_frame_equal(left, right, rtol=1e-3)
+                except AssertionError as e:
+                    if mismatch == "raise":
+                        raise e
+                    elif mismatch == "warn":
+                        warnings.warn(
+                            f"Data mismatch. Left: cache, Right: new\n{e}",
+                            RuntimeWarning,
+                        )
+                    elif isinstance(mismatch, int):
+                        LOG.log(
+                            mismatch, f"Data mismatch. Left: cache, Right: new\n{e}"
+                        )
 
-    # concat
-    df = concat([df_old, df], axis=0)
-    # drop duplicated index
-    df = df[~df.index.duplicated(keep=keep)]
-    await save(path, df, compress=compress, protocol=protocol)
+    # concat (skipped when nothing is cached, avoiding a needless copy)
+    if len(df_old) > 0:
+        df = concat([df_old, df], axis=0, sort=False)
+    # drop duplicated index; the boolean indexing copies the frame,
+    # so skip it entirely in the common non-overlapping case
+    if df.index.has_duplicates:
+        df = df[~df.index.duplicated(keep=keep)]
+    if format != "pickle" and isinstance(df.index, DatetimeIndex):
+        # Arrow formats do not store the freq attribute; drop it so that
+        # the returned DataFrame matches what a later read() will produce
+        df.index.freq = None
+    if incremental:
+        # ignore leftover .tmp files from interrupted save() calls,
+        # like read() does; they are not numbered parts
+        parts = (
+            sorted(p for p in path.iterdir() if not p.name.endswith(".tmp"))
+            if path.is_dir()
+            else []
+        )
+        # append only when the new data strictly extends what is on disk;
+        # otherwise (overlap, reload, too many parts) compact into one part
+        append = (
+            len(parts) > 0
+            and len(df_old) > 0
+            and idx is not None
+            and len(idx) == 0
+            and df.index.is_monotonic_increasing
+            and len(parts) < MAX_PARTS
+        )
+        if append:
+            n = int(parts[-1].stem) + 1
+            if df_new.index.has_duplicates:
+                df_new = df_new[~df_new.index.duplicated(keep=keep)]
+            await save(
+                _part_path(path, n, format),
+                df_new,
+                format=format,
+                compress=compress,
+                protocol=protocol,
+                compress_min_bytes=compress_min_bytes,
+            )
+        else:
+            if path.is_file():
+                # migrate an existing single-file cache in place; the file
+                # must be removed before a directory can take its name
+                path.unlink()
+            n = int(parts[-1].stem) + 1 if len(parts) > 0 else 0
+            await save(
+                _part_path(path, n, format),
+                df,
+                format=format,
+                compress=compress,
+                protocol=protocol,
+                compress_min_bytes=compress_min_bytes,
+            )
+            # drop the superseded parts only after the compacted part is
+            # on disk, so a crash mid-compaction never loses data; if it
+            # happens between save and unlink, the duplicated rows are
+            # deduplicated on the next update()
+            for part in parts:
+                part.unlink()
+        return df
+    await save(
+        path,
+        df,
+        format=format,
+        compress=compress,
+        protocol=protocol,
+        compress_min_bytes=compress_min_bytes,
+    )
     return df
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from pandas import DataFrame, date_range
+from pandas.testing import assert_frame_equal
+
+from cached_historical_data_fetcher.io import SUFFIXES, read, save, update
+
+
+class TestIo(IsolatedAsyncioTestCase):
+    def _df(self) -> DataFrame:
+        r = date_range("2021-01-01", periods=10, freq="D", tz="UTC")
+        return DataFrame({"value": range(10)}, index=r)
+
+    async def test_round_trip(self) -> None:
+        df = self._df()
+        df.index.freq = None
+        for format, suffix in SUFFIXES.items():
+            with TemporaryDirectory() as tmp:
+                path = Path(tmp) / f"cache{suffix}"
+                await save(path, df, format=format)  # type: ignore[arg-type]
+                df_read = await read(path)
+                assert_frame_equal(df, df_read, check_freq=False)
+
+    async def test_read_missing(self) -> None:
+        with TemporaryDirectory() as tmp:
+            df = await read(Path(tmp) / "missing.feather")
+            self.assertTrue(df.empty)
+
+    async def test_incremental(self) -> None:
+        df = self._df()
+        df.index.freq = None
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.feather"
+
+            # first write creates a single part
+            df_all = await update(path, df.iloc[:5], incremental=True)
+            self.assertEqual(len(list(path.iterdir())), 1)
+
+            # non-overlapping new rows are appended as a new part
+            df_all = await update(path, df.iloc[5:], df_old=df_all, incremental=True)
+            self.assertEqual(len(list(path.iterdir())), 2)
+            assert_frame_equal(await read(path), df, check_freq=False)
+
+            # overlapping data triggers compaction into one part
+            df_all = await update(path, df.iloc[7:], df_old=df_all, incremental=True)
+            self.assertEqual(len(list(path.iterdir())), 1)
+            assert_frame_equal(await read(path), df, check_freq=False)
+
+    async def test_incremental_ignores_tmp(self) -> None:
+        # a leftover .tmp file from an interrupted save() must not be
+        # mistaken for a part when numbering or compacting
+        df = self._df()
+        df.index.freq = None
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.feather"
+            df_all = await update(path, df.iloc[:5], incremental=True)
+            (path / "00000001.feather.tmp").touch()
+            df_all = await update(path, df.iloc[5:], df_old=df_all, incremental=True)
+            assert_frame_equal(await read(path), df, check_freq=False)
+            await update(path, df.iloc[3:], df_old=df_all, incremental=True)
+            assert_frame_equal(await read(path), df, check_freq=False)
+
+    async def test_pickle_fallback(self) -> None:
+        # object columns that Arrow cannot represent fall back to pickle
+        df = DataFrame({"value": [object(), object()]}, index=[0, 1])
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.feather"
+            await save(path, df, format="feather")
+            df_read = await read(path)
+            self.assertEqual(len(df_read), 2)
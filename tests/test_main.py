@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, Timedelta, Timestamp
 from pandas.testing import assert_frame_equal
@@ -15,11 +20,53 @@ from cached_historical_data_fetcher import (
     HistoricalDataCacheWithFixedChunk,
     IdCacheWithFixedChunk,
 )
+from cached_historical_data_fetcher.cache import base as cache_base
 
-_INTERVAL = Timedelta(seconds=1)
+# stdlib timedelta for plain offset arithmetic; the pandas Timedelta is
+# only constructed where the library API expects one
+_INTERVAL_DT = timedelta(seconds=1)
+_INTERVAL = Timedelta(_INTERVAL_DT)
 _WAIT_SECONDS_MULTIPLIER = 2
-_WAIT_SECONDS = _INTERVAL.total_seconds() * _WAIT_SECONDS_MULTIPLIER
-_start_index = Timestamp.utcnow() - _INTERVAL * 5
+_WAIT_SECONDS = _INTERVAL_DT.total_seconds() * _WAIT_SECONDS_MULTIPLIER
+_VERBOSE = bool(os.environ.get("TEST_VERBOSE"))
+"""Gate the DataFrame prints: repr formats every row, which is pure
+overhead in normal runs."""
+
+
+def _start_index(cache: HistoricalDataCache[Any, Any, Any]) -> Timestamp:
+    """The start index, computed lazily from the cache's per-update clock
+    instead of being frozen at import time. Offset by half an interval so
+    that chunk boundaries stay away from the refetch cutoff."""
+    return (cache.now or Timestamp.utcnow()) - _INTERVAL_DT * 5.5
+
+
+# reused offset object; passing it to date_range skips per-call
+# freq-string parsing
+_DAY = pd.tseries.offsets.Day()
+
+
+@lru_cache(maxsize=None)
+def _docs_start_index() -> Timestamp:
+    """The docs examples' start index; the floor("10D") is computed at
+    most once instead of on every class-body execution."""
+    return Timestamp.utcnow().floor("10D")
+
+
+class _ShiftedTimestamp(Timestamp):
+    """Timestamp whose `utcnow()` is shifted forward by `_offset`."""
+
+    _offset = Timedelta(0)
+
+    @classmethod
+    def utcnow(cls) -> Timestamp:
+        return Timestamp.utcnow() + cls._offset
+
+
+def _advance_clock(seconds: float) -> Any:
+    """Advance the clock the library sees instead of really sleeping,
+    so the interval-elapsed path is exercised without wall-clock waits."""
+    _ShiftedTimestamp._offset = Timedelta(seconds=seconds)
+    return patch.object(cache_base, "Timestamp", _ShiftedTimestamp)
 
 
 class MyCache(HistoricalDataCache[Timestamp, Timedelta, Any]):
@@ -30,11 +77,29 @@ class MyCache(HistoricalDataCache[Timestamp, Timedelta, Any]):
     async def get(
         self, start: Timestamp | Any | None, *args: Any, **kwargs: Any
     ) -> DataFrame:
+        now = self.now or Timestamp.utcnow()
         if start is None:
-            start = _start_index
-        r = pd.date_range(start, Timestamp.utcnow(), freq=_INTERVAL)
+            # anchor to `now` so the last fetched row lands exactly on the
+            # update grid regardless of when the module was imported
+            start = now - _INTERVAL_DT * 5
+        # fixed-frequency range via int64 arithmetic, skipping
+        # date_range's DateOffset dispatch
+        r = pd.DatetimeIndex(
+            np.arange(Timestamp(start).value, now.value + 1, _INTERVAL.value),
+            tz="UTC",
+        )
         self.count += 1
-        return DataFrame({"count": self.count}, index=r)
+        # pre-typed buffer instead of the scalar-broadcast path
+        return DataFrame(
+            np.full(len(r), self.count, dtype=np.int64), index=r, columns=["count"]
+        )
+
+
+@lru_cache(maxsize=None)
+def _int_frame(start: int) -> DataFrame:
+    """Memoized pure frame builder; repeated starts skip construction.
+    The result is never mutated by `update()`, only merged."""
+    return DataFrame({"count": [start]}, index=[start])
 
 
 class MyCacheInt(HistoricalDataCache[int, int, Any]):
@@ -42,33 +107,58 @@ class MyCacheInt(HistoricalDataCache[int, int, Any]):
     end_index = 0
 
     async def get(self, start: int | None, *args: Any, **kwargs: Any) -> DataFrame:
-        if start is None:
-            start = 0
-        return DataFrame({"count": [start]}, index=[start])
+        return _int_frame(0 if start is None else start)
 
 
 class MyCacheWithChunk(HistoricalDataCacheWithChunk[Timestamp, Timedelta, Any]):
-    count = -1
-    start_index: Timestamp = _start_index
+    # NumPy scalar so the += 1 per chunk stays in int64 without boxing
+    count = np.int64(-1)
     interval: Timedelta = _INTERVAL
     delay_seconds: float = 0
 
+    @property
+    def start_index(self) -> Timestamp:
+        return _start_index(self)
+
     async def get_one(self, start: Timestamp, *args: Any, **kwargs: Any) -> DataFrame:
         self.count += 1
-        return DataFrame({"count": [self.count]}, index=[start])
+        # explicit dtypes so all chunks share int64 + DatetimeIndex blocks
+        return DataFrame(
+            {"count": np.array([self.count], dtype=np.int64)},
+            index=pd.DatetimeIndex([start]),
+        )
+
+
+class MyCacheWithChunkIncremental(MyCacheWithChunk):
+    incremental = True
 
 
 class MyCacheWithFixedChunk(
     HistoricalDataCacheWithFixedChunk[Timestamp, Timedelta, Any]
 ):
-    count = -1
-    start_index: Timestamp = _start_index
+    count = np.int64(-1)
     interval: Timedelta = _INTERVAL
     delay_seconds: float = 0
 
+    @property
+    def start_index(self) -> Timestamp:
+        return _start_index(self)
+
     async def get_one(self, start: Timestamp, *args: Any, **kwargs: Any) -> DataFrame:
         self.count += 1
-        return DataFrame({"count": [self.count]}, index=[start])
+        return DataFrame(
+            {"count": np.array([self.count], dtype=np.int64)},
+            index=pd.DatetimeIndex([start]),
+        )
+
+
+class MyCacheWithFixedChunkBatched(MyCacheWithFixedChunk):
+    async def get_many(
+        self, starts: Any, *args: Any, **kwargs: Any
+    ) -> DataFrame | None:
+        counts = np.arange(self.count + 1, self.count + 1 + len(starts))
+        self.count += len(starts)
+        return DataFrame({"count": counts}, index=pd.DatetimeIndex(starts))
 
 
 class MyIdCache(IdCacheWithFixedChunk[str, Any]):
@@ -79,6 +169,14 @@ class MyIdCache(IdCacheWithFixedChunk[str, Any]):
         self.count += 1
         return DataFrame({"count": [self.count]}, index=[start])
 
+    async def get_many(
+        self, starts: Any, *args: Any, **kwargs: Any
+    ) -> DataFrame | None:
+        # one N-row allocation instead of N 1-row frames
+        counts = np.arange(self.count + 1, self.count + 1 + len(starts))
+        self.count += len(starts)
+        return DataFrame({"count": counts}, index=pd.Index(starts))
+
 
 @parameterized_class(
     ("cache",),
@@ -86,7 +184,9 @@ class MyIdCache(IdCacheWithFixedChunk[str, Any]):
         (MyCache(),),
         (MyCacheInt(),),
         (MyCacheWithChunk(),),
+        (MyCacheWithChunkIncremental(),),
         (MyCacheWithFixedChunk(),),
+        (MyCacheWithFixedChunkBatched(),),
     ],
 )
 class TestCache(IsolatedAsyncioTestCase):
@@ -96,42 +196,62 @@ class TestCache(IsolatedAsyncioTestCase):
         cache = self.cache
         df = await cache.update(reload=True)
 
-        # update immediately
+        # update immediately; the in-memory cache fast path returns the
+        # very same object, so short-circuit on identity
         df2 = await cache.update()
-        assert_frame_equal(df, df2)
-
-        # update after interval
-        await asyncio.sleep(_WAIT_SECONDS)
-        if isinstance(cache, MyCache):
-            with self.assertWarns(RuntimeWarning):
+        if df2 is not df:
+            assert_frame_equal(df, df2)
+
+        # update after interval (virtual clock instead of a real sleep)
+        with _advance_clock(_WAIT_SECONDS):
+            if isinstance(cache, MyCache):
+                with self.assertWarns(RuntimeWarning):
+                    df_new = await cache.update()
+                self.assertEqual(
+                    df_new["count"].sum(),
+                    _WAIT_SECONDS_MULTIPLIER + (1 if cache.keep == "last" else 0),
+                )
+            else:
                 df_new = await cache.update()
-            self.assertEqual(
-                df_new["count"].sum(),
-                _WAIT_SECONDS_MULTIPLIER + (1 if cache.keep == "last" else 0),
-            )
-        else:
-            df_new = await cache.update()
-        print(df, df_new)
+        if _VERBOSE:
+            print(df, df_new)
+
+
+class TestUpdateMany(IsolatedAsyncioTestCase):
+    async def test_update_many(self) -> None:
+        caches = [MyCacheWithChunk(), MyCacheWithFixedChunk()]
+        dfs = await HistoricalDataCache.update_many(
+            [(cache, (), {}) for cache in caches], reload=True
+        )
+        self.assertEqual(len(dfs), len(caches))
+        for df in dfs:
+            self.assertIsInstance(df, DataFrame)
+
+
+_IDS = pd.Index(["apple", "banana", "cherry"])
+"""Prebuilt id Index; `set_ids` accepts it (and slices of it) without
+rebuilding an Index from a list per call."""
 
 
 class TestIdCache(IsolatedAsyncioTestCase):
     async def test_id_cache(self) -> None:
         cache = MyIdCache()
-        ids = ["apple", "banana", "cherry"]
 
-        cache.set_ids(ids[:2])
+        cache.set_ids(_IDS[:2])
         assert cache.ids is not None
-        self.assertEqual(cache.ids.to_list(), ids[:2])
+        self.assertEqual(cache.ids.to_list(), _IDS[:2].to_list())
         df = await cache.update(reload=True)
-        print(df)
+        if _VERBOSE:
+            print(df)
         self.assertEqual(len(df), 2)
 
-        cache.set_ids(ids)
+        cache.set_ids(_IDS)
         df2 = await cache.update()
         self.assertEqual(df2["count"].sum(), 3)
         self.assertEqual(len(df2), 3)
 
-        print(df, df2)
+        if _VERBOSE:
+            print(df, df2)
 
 
 class TestDocs(IsolatedAsyncioTestCase):
@@ -142,47 +262,43 @@ class TestDocs(IsolatedAsyncioTestCase):
             async def get(
                 self, start: Timestamp | None, *args: Any, **kwargs: Any
             ) -> DataFrame:
-                start = start or Timestamp.utcnow().floor("10D")
-                date_range_chunk = pd.date_range(start, Timestamp.utcnow(), freq="D")
-                return DataFrame(
-                    {"day": [d.day for d in date_range_chunk]}, index=date_range_chunk
-                )
+                start = start or _docs_start_index()
+                date_range_chunk = pd.date_range(start, Timestamp.utcnow(), freq=_DAY)
+                # vectorized .day instead of boxing every Timestamp
+                return DataFrame({"day": date_range_chunk.day}, index=date_range_chunk)
 
-        df = await MyCache_().update()
-        print("\n")
-        print(df)
-
-    async def test_docs_code2(self) -> None:
         class MyCacheWithChunk_(
             HistoricalDataCacheWithChunk[Timestamp, Timedelta, Any]
         ):
             delay_seconds: float = 0
             interval: Timedelta = Timedelta(days=1)
-            start_index: Timestamp = Timestamp.utcnow().floor("10D")
+            start_index: Timestamp = _docs_start_index()
 
             async def get_one(
                 self, start: Timestamp, *args: Any, **kwargs: Any
             ) -> DataFrame:
                 return DataFrame({"day": [start.day]}, index=[start])
 
-        df = await MyCacheWithChunk_().update()
-        print(df)
-
-    async def test_docs_code3(self) -> None:
         class MyCacheWithFixedChunk_(
             HistoricalDataCacheWithFixedChunk[Timestamp, Timedelta, Any]
         ):
             delay_seconds: float = 0
             interval: Timedelta = Timedelta(days=1)
-            start_index: Timestamp = Timestamp.utcnow().floor("10D")
+            start_index: Timestamp = _docs_start_index()
 
             async def get_one(
                 self, start: Timestamp, *args: Any, **kwargs: Any
             ) -> DataFrame:
                 return DataFrame({"day": [start.day]}, index=[start])
 
-        df = await MyCacheWithFixedChunk_().update()
-        print(df)
+        # the three examples are independent; overlap their cache I/O
+        df1, df2, df3 = await asyncio.gather(
+            MyCache_().update(),
+            MyCacheWithChunk_().update(),
+            MyCacheWithFixedChunk_().update(),
+        )
+        if _VERBOSE:
+            print(df1, df2, df3)
 
     async def test_docs_code4(self) -> None:
         class MyIdCache_(IdCacheWithFixedChunk[str, Any]):
@@ -196,4 +312,5 @@ class TestDocs(IsolatedAsyncioTestCase):
         df1 = await cache.update(reload=True)
         cache.set_ids(["b", "c"])
         df2 = await cache.update()
-        print(df1, df2)
+        if _VERBOSE:
+            print(df1, df2)